@@ -32,6 +32,7 @@ __license__ = """
  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import weakref
 import numpy as np
 import jax.numpy as jnp
 
@@ -56,6 +57,62 @@ Certain zone arguments with defaults are still necessary when a reduction is oth
 
 ## Plotting reductions ##
 
+# Sums over phi of named variables, kept per FluidState object.  See phi_sum
+_phi_sums = weakref.WeakKeyDictionary()
+
+def phi_sum(dump, var):
+    """Sum of the named variable 'var' over phi, cached so that other plots of the same dump can re-use it.
+    The result is shared between callers, so never modify it in place.
+    Note sums are *not* GR-aware!
+    """
+    sums = _phi_sums.setdefault(dump, {})
+    if var not in sums:
+        sums[var] = dump[var].sum(-1)
+    return sums[var]
+
+# Slices of each FluidState at single ranks of X2 or X3, kept so that plots of several variables
+# (or several components of one vector) from the same slice share its cache.  See _slice_at
+_rank_slices = weakref.WeakKeyDictionary()
+
+def _slice_at(dump, axis, at):
+    """Return dump sliced to the single rank 'at' along 'axis' (1 or 2), re-using any previous slice"""
+    slices = _rank_slices.setdefault(dump, {})
+    key = (axis, int(at))
+    if key not in slices:
+        slc = [slice(None), slice(None), slice(None)]
+        slc[axis] = key[1]
+        slices[key] = dump[tuple(slc)]
+    return slices[key]
+
+# Elements of var per block in _phi_counts, keeping its temporaries to a few MB
+_COUNT_BLOCK = 2**20
+
+def _phi_counts(var, test, nout):
+    """Sum over phi of the boolean (N1, N2, N3, nout) array test(var), computed in blocks of X1
+    so that var is only read once, without ever holding the whole boolean array.
+    Returns the counts in the shape (nout, N1, N2).
+    """
+    n1, n2, n3 = var.shape
+    out = np.zeros((nout, n1, n2), dtype=np.int64)
+    step = max(1, _COUNT_BLOCK // (n2 * n3))
+    for i in range(0, n1, step):
+        out[:, i:i+step] = np.moveaxis(test(np.asarray(var[i:i+step])).sum(2), -1, 0)
+    return out
+
+def phi_value_counts(var, values):
+    """Count the ranks in X3 where integer array var equals each of 'values', in one pass over var.
+    Returns an array of shape (len(values), N1, N2).
+    """
+    values = np.asarray(values)
+    return _phi_counts(var, lambda v: v[..., None] == values, len(values))
+
+def phi_bit_counts(var, bits):
+    """Count the ranks in X3 where each of 'bits' is set in the integer (bit flag) array var,
+    in one pass over var.  Returns an array of shape (len(bits), N1, N2).
+    """
+    bits = np.asarray(bits)
+    return _phi_counts(var, lambda v: (v[..., None] & bits) != 0, len(bits))
+
 def flatten_xz(dump, var, at=None, sum=False, half_cut=False):
     """Return an X-Z slice or sum of var, generally for use in making a plot.
     By default takes both the 0-degree (right side) and 180-degree (left side) slices,
@@ -68,8 +125,11 @@ def flatten_xz(dump, var, at=None, sum=False, half_cut=False):
     """
     if sum:
         if isinstance(var, str):
-            var = dump[var]
-        if len(var.shape) == 3:
+            var = phi_sum(dump, var)
+            if half_cut:
+                # Don't hand out the cached sum itself
+                return var.copy()
+        elif len(var.shape) == 3:
             var = var.sum(-1)
         if half_cut:
             return var
@@ -80,9 +140,10 @@ def flatten_xz(dump, var, at=None, sum=False, half_cut=False):
             at = 0
         if isinstance(var, str):
             if half_cut:
-                return jnp.squeeze(dump[:, :, at][var])
+                return jnp.squeeze(_slice_at(dump, 2, at)[var])
             else:
-                return jnp.append(jnp.squeeze(dump[:, :, at][var]), jnp.flip(jnp.squeeze(dump[:, :, at + dump['n3']//2][var]), 1), 1)
+                return jnp.append(jnp.squeeze(_slice_at(dump, 2, at)[var]),
+                                  jnp.flip(jnp.squeeze(_slice_at(dump, 2, at + dump['n3']//2)[var]), 1), 1)
         else:
             if half_cut:
                 if len(var.shape) == 3:
@@ -106,7 +167,7 @@ def flatten_xy(dump, var, at=None, sum=False):
         if at is None:
             at = dump['n2']//2
         if isinstance(var, str):
-            return jnp.squeeze(dump[:, at, :][var])
+            return jnp.squeeze(_slice_at(dump, 1, at)[var])
         else:
             return var[:, at, :]
 
@@ -197,6 +258,32 @@ def shell_sum(dump, var, at_r=None, at_i=None, th_slice=None, j_slice=None, mask
     return jnp.squeeze(jnp.sum(integrand, axis=(1, 2)))
 
 
+def shell_sums_T_mixed(dump, components, mass_flux=False):
+    """Radial profiles of ``shell_sum(dump, T_mixed(dump, i, j))`` for several components (i, j) at once.
+    Factors shared between the components of T (enthalpy, pressure, the geometry, etc.) are computed
+    only once, rather than once per component.
+
+    :param components: list of tuples (i, j), upper and lower index of T^i_j
+    :param mass_flux: also return the shell sum of rho u^0, as the last element of the list
+    """
+    gam = dump['gam']
+    enthalpy = dump['RHO'] + gam * dump['UU'] + dump['bsq']
+    ptot = (gam - 1) * dump['UU'] + dump['bsq'] / 2
+    ucon, ucov = dump['ucon'], dump['ucov']
+    bcon, bcov = dump['bcon'], dump['bcov']
+    jacobian = dump['gdet'] * dump['dx2'] * dump['dx3']
+
+    out = []
+    for i, j in components:
+        T = enthalpy * ucon[i] * ucov[j] - bcon[i] * bcov[j]
+        if i == j:
+            T = T + ptot
+        out.append(jnp.squeeze(jnp.sum(T * jacobian, axis=(1, 2))))
+    if mass_flux:
+        out.append(jnp.squeeze(jnp.sum(dump['RHO'] * ucon[0] * jacobian, axis=(1, 2))))
+    return out
+
+
 def shell_avg(dump, var, **kwargs):
     """Average a variable over spherical shells. Returns a radial profile (array length N1) or single-shell average.
     See shell_sum for arguments.
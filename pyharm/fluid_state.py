@@ -210,15 +210,14 @@ class FluidState:
             # TODO somehow proper copy constructor
             slc = tuple(new_slc)
 
-            # Pass nothing if we're in-memory only -- we'll copy the cache
+            cache = {c: self.cache[c][(Ellipsis,) + slc] for c in self.cache}
+            # In-memory states are constructed from the sliced cache, as there's nothing else to read
             if self.fname == "memory_array":
-                out = FluidState({}, add_grid=False, params=self.params, units=self.units)
+                out = FluidState(cache, add_grid=False, params=self.params, units=self.units)
             else:
                 out = FluidState(self.fname, add_grid=False, params=self.params, units=self.units, multizone=self.multizone)
-
-            # Forcibly add the cache
-            for c in self.cache:
-                out.cache[c] = self.cache[c][(Ellipsis,) + slc]
+                # Forcibly add the cache
+                out.cache.update(cache)
             if self.grid is not None:
                 out.grid = self.grid[slc]
             out.slice = slc
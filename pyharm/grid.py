@@ -158,6 +158,8 @@ class Grid:
         # Total grid size (all MPI processes)
         self.params = params
         self.cache = {}
+        # Plotting locations, see get_xz_locations.  Kept separately as they are not sliced with the grid
+        self.plot_cache = {}
         if 'n1tot' in params:
             self.NTOT = jnp.array([1, params['n1tot'], params['n2tot'], params['n3tot']])
         else:
@@ -428,11 +430,14 @@ class Grid:
         :param native: get native X1/X2 coordinates rather than Cartesian x,z locations
         :param half_cut: get only the slice at phi=0
         """
-        # TODO cache this!
         # TODO oblate option for x=sqrt(r^2 + a^2) rather than r
         if native:
             # We always want one "pane" when plotting in native coords
             half_cut = True
+        # Every panel of a figure asks for the same locations, so only calculate them once
+        key = ('xz', mesh, native, half_cut, log_r)
+        if key in self.plot_cache:
+            return self.plot_cache[key]
         if mesh:
             # We need a continouous set of corners representing phi=0/pi
             m = self.coord_ij_mesh(at=(0, self.NTOT[3]//2))
@@ -456,7 +461,8 @@ class Grid:
             x = self.coords.cart_x(m, log_r)
             z = self.coords.cart_z(m, log_r)
 
-        return jnp.squeeze(x), jnp.squeeze(z)
+        self.plot_cache[key] = (jnp.squeeze(x), jnp.squeeze(z))
+        return self.plot_cache[key]
 
     def get_xy_locations(self, mesh=False, native=False, log_r=False):
         """Get the mesh locations x_ij and y_ij needed for plotting a midplane slice.
@@ -466,8 +472,10 @@ class Grid:
         :param native: get native X1/X3 coordinates rather than Cartesian x,z locations
         :param log_r: logarithmically compress the radial coordinate
         """
-        # TODO cache this!
         # TODO oblate option for x,y=sqrt(r^2 + a^2) rather than r
+        key = ('xy', mesh, native, log_r)
+        if key in self.plot_cache:
+            return self.plot_cache[key]
         if mesh:
             m = self.coord_ik_mesh(at=self.NTOT[2]//2)
         else:
@@ -479,8 +487,9 @@ class Grid:
         else:
             x = self.coords.cart_x(m, log_r)
             y = self.coords.cart_y(m, log_r)
-        
-        return jnp.squeeze(x), jnp.squeeze(y)
+
+        self.plot_cache[key] = (jnp.squeeze(x), jnp.squeeze(y))
+        return self.plot_cache[key]
 
     def get_xz_areas(self, **kwargs):
         """Get cell areas in the plotting plane using the trapezoid area function
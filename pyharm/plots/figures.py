@@ -33,26 +33,72 @@ __license__ = """
 """
 
 import sys
+import zlib
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib import gridspec
 
-from ..ana.reductions import *
-from .plot_dumps import *
-from .plot_results import *
+from ..ana.reductions import shell_sums_T_mixed, phi_value_counts, phi_bit_counts
+from ..ana_results import AnaResults
 from ..defs import FloorFlag_KHARMA, FloorFlag_iharm3d, InversionStatus
+from ..util import i_of
+from .plot_dumps import plot_xz, plot_xy, plot_thphi, plot_slices
+from .plot_results import plot_hst
+from .pretty import pretty
 
 __doc__ = \
 """Various full figures, combining plots & settings frequently used together.
 Similar to the file of the same name in imtools.
 """
 
+def _subplot(fig, *args, **kwargs):
+    """Like fig.add_subplot, but return the Axes made previously with the same arguments, if any.
+    This avoids creating new Axes each frame when figures are re-used, see _reset_figure.
+    """
+    cache = fig.__dict__.setdefault('_pyharm_axes', {})
+    key = (tuple(a.get_geometry() if isinstance(a, gridspec.SubplotSpec) else a for a in args),
+           kwargs.get('projection', None))
+    if key not in cache or cache[key] not in fig.axes:
+        cache[key] = fig.add_subplot(*args, **kwargs)
+    return cache[key]
+
+def _reset_figure(fig):
+    """Prepare a figure for drawing the next frame: clear every Axes created by _subplot,
+    and remove anything else (e.g. colorbars, which are re-added by the plotting functions).
+    """
+    keep = list(fig.__dict__.get('_pyharm_axes', {}).values())
+    # Remove colorbars first, while the plots they belong to still exist
+    for ax in fig.axes:
+        if ax not in keep:
+            ax.remove()
+    for ax in fig.axes:
+        # History plots only need their time marker moved, see _plot_hst
+        if '_pyharm_hst' not in ax.__dict__:
+            ax.cla()
+    fig.suptitle("")
+
+def _plot_hst(ax, diag, var, tline, **kwargs):
+    """Call plot_hst once, then on re-used figures (see _reset_figure) just move the time marker.
+    Accepts either an AnaResults object or the raw dictionary from reading a history file.
+    """
+    # frame() runs in a Pool, which hands each chunk of frames a fresh copy of diag,
+    # and re-used figures outlive one model, so recognize the same curve by its contents
+    ana = diag if isinstance(diag, AnaResults) else AnaResults(diag)
+    t, v = ana.get_result('t', var)
+    key = (var, zlib.crc32(np.asarray(t).tobytes()), zlib.crc32(np.asarray(v).tobytes()))
+    last = ax.__dict__.get('_pyharm_hst', None)
+    if last is not None and last[0] == key and last[1] in ax.lines:
+        last[1].set_xdata([tline, tline])
+        return
+    ax.cla()
+    cursor = plot_hst(ax, ana, var, tline=tline, **kwargs)
+    ax._pyharm_hst = (key, cursor)
+
 # TODO a call-through interface here in the form:
 # def figure(name, dump, output **kwargs)
 # Set sensible defaults for actually calling these things, update w/kwargs
 
 def oned(fig, dump, diag, plotrc, var='RHO'):
-    ax = plt.subplot(1,1,1)
+    ax = _subplot(fig, 1,1,1)
     ax.plot(np.squeeze(dump['x']), np.squeeze(dump[var]))
     return fig
 
@@ -64,11 +110,11 @@ def simplest(fig, dump, diag, plotrc, type="both", var='log_rho'):
     Note that this animation fudges colorbars, using different scales for left & right
     """
     if type == "both":
-        xz_slc = plt.subplot(1, 2, 1)
-        xy_slc = plt.subplot(1, 2, 2)
+        xz_slc = _subplot(fig, 1, 2, 1, projection='thin')
+        xy_slc = _subplot(fig, 1, 2, 2, projection='thin')
     else:
-        xz_slc = plt.subplot(1, 1, 1)
-        xy_slc = plt.subplot(1, 1, 1)
+        xz_slc = _subplot(fig, 1, 1, 1, projection='thin')
+        xy_slc = xz_slc
     
     if not 'plane' in plotrc or plotrc['plane'] is None:
         plane = "both"
@@ -83,13 +129,13 @@ def simplest(fig, dump, diag, plotrc, type="both", var='log_rho'):
     if plane in ("poloidal", "both"):
         plot_xz(xz_slc, dump, var, label="",
                 xlabel=False, ylabel=False, xticks=[], yticks=[],
-                cbar=False, frame=False, **plotrc)
+                cbar=False, frame=False, quantize=True, **plotrc)
     if plane in ("toroidal", "both"):
         plotrc['vmin'] = plotrc['vmin'] + 0.15
         plotrc['vmax'] = plotrc['vmax'] + 0.15
         plot_xy(xy_slc, dump, var, label="",
                 xlabel=False, ylabel=False, xticks=[], yticks=[],
-                cbar=False, frame=False, **plotrc)
+                cbar=False, frame=False, quantize=True, **plotrc)
     xz_slc.axis('off')
     xy_slc.axis('off')
     fig.subplots_adjust(hspace=0, wspace=0, left=0, right=1, bottom=0, top=1)
@@ -102,7 +148,7 @@ def simplest_half(fig, dump, diag, plotrc, type="both", var='rho'):
     """Slices of the log10 of one variable without color bars for outreach animations.
     Half of X-Z plot only
     """
-    xz_slc = plt.subplot(1, 1, 1)
+    xz_slc = _subplot(fig, 1, 1, 1, projection='thin')
 
     if 'vmin' not in plotrc or plotrc['vmin'] is None:
         plotrc['vmin'] = 1e-4
@@ -112,7 +158,7 @@ def simplest_half(fig, dump, diag, plotrc, type="both", var='rho'):
 
     plot_xz(xz_slc, dump, var, label="", half_cut=True,
             xlabel=False, ylabel=False, xticks=[], yticks=[],
-            cbar=False, frame=False, **plotrc)
+            cbar=False, frame=False, quantize=True, **plotrc)
 
     xz_slc.axis('off')
     fig.subplots_adjust(hspace=0, wspace=0, left=0, right=1, bottom=0, top=1)
@@ -125,11 +171,12 @@ def simpler(fig, dump, diag, plotrc):
     """Like 'simplest', but with EH magnetization phi_b
     """
     gs = gridspec.GridSpec(2, 2, height_ratios=[6, 1], width_ratios=[16, 17])
-    ax_slc = [plt.subplot(gs[0, 0]), plt.subplot(gs[0, 1])]
-    ax_flux = [plt.subplot(gs[1, :])]
+    ax_slc = [_subplot(fig, gs[0, 0]), _subplot(fig, gs[0, 1])]
+    ax_flux = [_subplot(fig, gs[1, :])]
     plotrc['log'] = True
+    plotrc['quantize'] = True
     plot_slices(ax_slc[0], ax_slc[1], dump, 'rho', **plotrc)
-    plot_hst(ax_flux[0], diag, 'phi_b', tline=dump['t'])
+    _plot_hst(ax_flux[0], diag, 'phi_b', dump['t'])
     # Make sure frame.py doesn't set a title
     plotrc['no_title'] = True
     return fig
@@ -138,13 +185,13 @@ def simple(fig, dump, diag, plotrc):
     """Like 'simpler', but adds accretion rate Mdot
     """
     gs = gridspec.GridSpec(3, 2, height_ratios=[4, 1, 1])
-    ax_slc = [plt.subplot(gs[0, 0]), plt.subplot(gs[0, 1])]
-    ax_flux = [plt.subplot(gs[1, :]), plt.subplot(gs[2, :])]
+    ax_slc = [_subplot(fig, gs[0, 0]), _subplot(fig, gs[0, 1])]
+    ax_flux = [_subplot(fig, gs[1, :]), _subplot(fig, gs[2, :])]
     plotrc['log'] = True
+    plotrc['quantize'] = True
     plot_slices(ax_slc[0], ax_slc[1], dump, 'rho', **plotrc)
-    ana = AnaResults(diag)
-    plot_hst(ax_flux[0], ana, 'Mdot', tline=dump['t'], xlabel="", xticklabels=[])
-    plot_hst(ax_flux[1], ana, 'phi_b', tline=dump['t'])
+    _plot_hst(ax_flux[0], diag, 'Mdot', dump['t'], xlabel="", xticklabels=[])
+    _plot_hst(ax_flux[1], diag, 'phi_b', dump['t'])
     fig.subplots_adjust(hspace=0.25, bottom=0.05, top=0.95)
     # Make sure frame.py doesn't set a title
     plotrc['no_title'] = True
@@ -154,8 +201,8 @@ def traditional(fig, dump, diag, plotrc):
     """8-pane movie: XZ and XY slices of rho & UU on top,
     with a zoomed version and EH fluxes on the bottom
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
-    ax_flux = lambda i: plt.subplot(4, 2, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
+    ax_flux = lambda i: _subplot(fig, 4, 2, i)
     # Usual movie: RHO beta fluxes
     # CUTS
     plotrc['log'] = True
@@ -171,9 +218,8 @@ def traditional(fig, dump, diag, plotrc):
 
     # FLUXES
     if diag is not None:
-        ana = AnaResults(diag)
-        plot_hst(ax_flux(6), ana, 'mdot', tline=dump['t'], xticklabels=[])
-        plot_hst(ax_flux(8), ana, 'phi_b', tline=dump['t'])
+        _plot_hst(ax_flux(6), diag, 'mdot', dump['t'], xticklabels=[])
+        _plot_hst(ax_flux(8), diag, 'phi_b', dump['t'])
         plotrc['no_title'] = True # We have an indication of the time, so don't title with it
     else:
         print("Not plotting fluxes!", file=sys.stderr)
@@ -185,7 +231,11 @@ def traditional(fig, dump, diag, plotrc):
 def prims(fig, dump, diag, plotrc, log=True, simple=False, type="poloidal"):
     """Each primitive variable in each of 8 panes
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    if simple:
+        # No ticks or frames, so skip building them
+        ax_slc = lambda i: _subplot(fig, 2, 4, i, projection='thin')
+    else:
+        ax_slc = lambda i: _subplot(fig, 2, 4, i)
     if type == "poloidal":
         fn = plot_xz
     else:
@@ -193,7 +243,7 @@ def prims(fig, dump, diag, plotrc, log=True, simple=False, type="poloidal"):
     if simple:
         plotrc.update({'xlabel': False, 'ylabel': False,
                        'xticks': [], 'yticks': [], 'log': log,
-                       'cbar': False, 'frame': False, 'no_title': True})
+                       'cbar': False, 'frame': False, 'no_title': True, 'quantize': True})
     for i,var in enumerate(['RHO', 'UU', 'U1', 'U2', 'U3', 'B1', 'B2', 'B3']):
         fn(ax_slc(i+1), dump, var, **plotrc)
     if simple:
@@ -203,12 +253,12 @@ def prims(fig, dump, diag, plotrc, log=True, simple=False, type="poloidal"):
 def vecs_prim(fig, dump, diag, plotrc):
     """Poloidal plots of primitive vector components U1,U2,U3,B1,B2,B3 along with plots of rho
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     # Usual movie: RHO beta fluxes
     # CUTS
     plotrc['average'] = True
     plotrc['log'] = True
-    plot_slices(ax_slc(1), ax_slc(5), dump, 'rho', *plotrc)
+    plot_slices(ax_slc(1), ax_slc(5), dump, 'rho', **plotrc)
 
     for i,var in zip((2,3,4,6,7,8), ("U1", "U2", "U3", "B1", "B2", "B3")):
         plot_xz(ax_slc(i), dump, var, **plotrc)
@@ -219,7 +269,7 @@ def vecs_cov(fig, dump, diag, plotrc):
     """Covariant 4-vector components ucov, bcov
     """
     plotrc['log'] = True
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     for i,var in zip((1,2,3,4,5,6,7,8), ("u_0", "u_r", "u_th", "u_3","b_0", "b_r", "b_th", "b_3")):
         plot_xz(ax_slc(i), dump, var, **plotrc)
     
@@ -229,7 +279,7 @@ def vecs_con(fig, dump, diag, plotrc):
     """Contravariant 4-vector components ucon, bcon
     """
     plotrc['log'] = True
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     for i,var in zip((1,2,3,4,5,6,7,8), ("u^0", "u^r", "u^th", "u^3","b^0", "b^r", "b^th", "b^3")):
         plot_xz(ax_slc(i), dump, var, **plotrc)
     
@@ -238,7 +288,7 @@ def vecs_con(fig, dump, diag, plotrc):
 def ejection(fig, dump, diag, plotrc):
     """Density and magnetic pressure, averaged over phi
     """
-    ax_slc = lambda i: plt.subplot(1, 2, i)
+    ax_slc = lambda i: _subplot(fig, 1, 2, i)
     plotrc['average'] = True
     plot_xz(ax_slc(1), dump, 'rho', label=pretty('rho')+" phi-average", **plotrc)
     plot_xz(ax_slc(2), dump, 'Pb', label=pretty('Pb')+" phi-average", **plotrc)
@@ -247,30 +297,34 @@ def ejection(fig, dump, diag, plotrc):
 def e_ratio(fig, dump, diag, plotrc):
     """Energy ratios, for highlighting tough spots and checking floors are applied there
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     plotrc['vmin'] = -3
     plotrc['vmax'] = 3
     plotrc['average'] = True
+    plotrc['log'] = True
     # Energy ratios: difficult places to integrate, with failures
-    plot_slices(ax_slc(1), ax_slc(2), dump, 'log_Theta',
+    # Each is used for both slices, so compute the full arrays once here
+    Theta, sigma, inv_beta = dump['Theta'], dump['sigma'], dump['inv_beta']
+    plot_slices(ax_slc(1), ax_slc(2), dump, Theta,
                         label=r"$\log_{10}(U / \rho)$", **plotrc)
-    plot_slices(ax_slc(3), ax_slc(4), dump, 'log_sigma',
+    plot_slices(ax_slc(3), ax_slc(4), dump, sigma,
                         label=r"$\log_{10}(b^2 / \rho)$", **plotrc)
-    plot_slices(ax_slc(5), ax_slc(6), dump, 'log_inv_beta',
+    plot_slices(ax_slc(5), ax_slc(6), dump, inv_beta,
                         label=r"$\beta^{-1}$", **plotrc)
     plotrc['vmin'] = 0
     plotrc['vmax'] = 20
     plotrc['cmap'] = 'Reds'
     plotrc['average'] = False
     plotrc['sum'] = True
-    plot_slices(ax_slc(7), ax_slc(8), dump, (dump['pflag'] > 0).astype(np.int32),
+    plotrc['log'] = False
+    plot_slices(ax_slc(7), ax_slc(8), dump, 'fail_mask',
                         label="Failures", **plotrc)
     return fig
 
 def e_ratio_funnel(fig, dump, diag, plotrc):
     """Energy ratios on the sphere at a given radius
     """
-    ax_slc = lambda i: plt.subplot(1, 4, i)
+    ax_slc = lambda i: _subplot(fig, 1, 4, i)
     # Energy ratios: difficult places to integrate, with failures
 
     r_i = i_of(dump['r1d'], plotrc['radius'])
@@ -289,56 +343,65 @@ def e_ratio_funnel(fig, dump, diag, plotrc):
     plotrc['cmap'] = 'Reds'
     plotrc['average'] = False
     plotrc['sum'] = True
-    plot_thphi(ax_slc(4), dump, (dump['pflag'] > 0).astype(np.int32), r_i,
+    plot_thphi(ax_slc(4), dump, 'fail_mask', r_i,
                         label="Failures", **plotrc)
     return fig
 
-# def conservation(fig, dump, diag, plotrc):
-#     """TODO this is still WIP to restore. Later."""
-#     ax_slc = lambda i: plt.subplot(2, 4, i)
-#     ax_flux = lambda i: plt.subplot(4, 2, i)
-#     # Continuity plots to verify local conservation of energy, angular + linear momentum
-#     # Integrated T01: continuity for momentum conservation
-#     plotrc['native'] = True
-#     plotrc['vmin'] = 0
-#     plotrc['vmax'] = 2000
-#     plotrc['sum'] = True
-#     plot_slices(ax_slc(1), ax_slc(2), dump, 'JE1', label=r"$T^1_0$ Integrated")
-
-#     # integrated T00: continuity plot for energy conservation
-#     plotrc['vmax'] = 3000
-#     plot_slices(ax_slc(5), ax_slc(6), dump, 'JE0', label=r"$T^0_0$ Integrated")
-
-#     # Usual fluxes for reference
-#     #ppltr.plot_hst(ax_flux[1], diag, 'Mdot', tline=dump['t'], logy=MDOT)
-
-#     r_out = 100
-
-#     # Radial conservation plots
-#     E_r = shell_sum(dump, T_mixed(dump, 0, 0))
-#     Ang_r = shell_sum(dump, T_mixed(dump, 0, 3))
-#     mass_r = shell_sum(dump, dump['ucon'][0] * dump['RHO'])
-
-#     max_e = 50000
-#     # TODO these will need some work to fully go to just ax.plot calls
-#     ax_flux(2).plot(dump['r1d'], np.abs(E_r), title='Conserved vars at R', ylim=(0, max_e), rlim=(0, r_out), label="E_r")
-#     ax_flux(2).plot(dump['r1d'], np.abs(Ang_r) / 10, ylim=(0, max_e), rlim=(0, r_out), color='r', label="L_r")
-#     ax_flux(2).plot(dump['r1d'], np.abs(mass_r), ylim=(0, max_e), rlim=(0, r_out), color='b', label="M_r")
-#     ax_flux(2).legend()
-
-#     # Radial energy accretion rate
-#     Edot_r = shell_sum(dump, T_mixed(dump, 1, 0))
-#     ax_flux(4).plot(dump['r1d'], Edot_r, label='Edot at R', ylim=(-200, 200), rlim=(0, r_out), native=True)
-
-#     # Radial integrated failures
-#     ax_flux(6).plot(dump['r1d'], (dump['pflag'] > 0).sum(axis=(1, 2)), label='Fails at R', native=True, rlim=(0, r_out), ylim=(0, 1000))
+def conservation(fig, dump, diag, plotrc):
+    """Continuity plots to verify local conservation of energy, angular + linear momentum,
+    with radial profiles of the conserved quantities and of inversion failures
+    """
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
+    ax_flux = lambda i: _subplot(fig, 4, 2, i)
+    # Integrated T01: continuity for momentum conservation
+    plotrc['native'] = True
+    plotrc['window'] = None
+    plotrc['vmin'] = 0
+    plotrc['vmax'] = 2000
+    plotrc['sum'] = True
+    plot_slices(ax_slc(1), ax_slc(2), dump, 'JE1', label=r"$T^1_0$ Integrated", **plotrc)
+
+    # integrated T00: continuity plot for energy conservation
+    plotrc['vmax'] = 3000
+    plot_slices(ax_slc(5), ax_slc(6), dump, 'JE0', label=r"$T^0_0$ Integrated", **plotrc)
+
+    # Radial conservation plots.  Only compute (and draw) the zones we'll see
+    r_out = 100
+    i_out = np.searchsorted(dump['r1d'], r_out)
+    inner = dump[:i_out, :, :]
+    r = dump['r1d'][:i_out]
+    E_r, Ang_r, Edot_r, mass_r = shell_sums_T_mixed(inner, [(0, 0), (0, 3), (1, 0)], mass_flux=True)
+
+    max_e = 50000
+    ax = ax_flux(2)
+    ax.plot(r, np.abs(E_r), label="E_r")
+    ax.plot(r, np.abs(Ang_r) / 10, color='r', label="L_r")
+    ax.plot(r, np.abs(mass_r), color='b', label="M_r")
+    ax.set_title('Conserved vars at R')
+    ax.set_xlim(0, r_out)
+    ax.set_ylim(0, max_e)
+    ax.legend()
+
+    # Radial energy accretion rate
+    ax = ax_flux(4)
+    ax.plot(r, Edot_r, label='Edot at R')
+    ax.set_xlim(0, r_out)
+    ax.set_ylim(-200, 200)
+    ax.legend()
+
+    # Radial integrated failures
+    ax = ax_flux(6)
+    ax.plot(r, inner['fail_mask'].sum(axis=(1, 2)), label='Fails at R')
+    ax.set_xlim(0, r_out)
+    ax.set_ylim(0, 1000)
+    ax.legend()
 
-#     return fig
+    return fig
 
 def energies(fig, dump, diag, plotrc):
     """Energy scalars rho, u, b^2 plotted along with inversion failures
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     # Set particular vmin/max
     plotrc['half_cut'] = True
     plotrc['vmin'] = -3
@@ -356,7 +419,7 @@ def energies(fig, dump, diag, plotrc):
     plotrc['cmap'] = 'Reds'
     plotrc['average'] = False
     plotrc['sum'] = True
-    plot_slices(ax_slc(7), ax_slc(8), dump, (dump['pflag'] > 0).astype(np.int32),
+    plot_slices(ax_slc(7), ax_slc(8), dump, 'fail_mask',
                         label="Failures", **plotrc)
 
     return fig
@@ -364,7 +427,7 @@ def energies(fig, dump, diag, plotrc):
 def floors(fig, dump, diag, plotrc):
     """Plot which floor are hit where
     """
-    ax_slc = lambda i: plt.subplot(2, 5, i)
+    ax_slc = lambda i: _subplot(fig, 2, 5, i)
     plotrc['xlabel'] = False
     plotrc['xticks'] = []
     plotrc['log'] = True
@@ -374,6 +437,9 @@ def floors(fig, dump, diag, plotrc):
     plotrc['cmap'] = 'Reds'
     plotrc['sum'] = True
     plotrc['log'] = False
+    fflag = dump['fflag']
+    # Decode every flag in one pass over fflag.  Panels show the summed flag values, as before
+    hits = phi_bit_counts(fflag, [ff.value for ff in FloorFlag_KHARMA])
     for i,ff in enumerate(FloorFlag_KHARMA):
         p = 2+i
         plotrc['cbar'] = (p % 5 == 0)
@@ -391,15 +457,15 @@ def floors(fig, dump, diag, plotrc):
             plotrc['ylabel'] = True
             plotrc['yticks'] = None
 
-        plot_xz(ax_slc(p), dump, dump['fflag'] & ff.value, label=ff.name, **plotrc)
+        plot_xz(ax_slc(p), dump, hits[i] * ff.value, label=ff.name, **plotrc)
     fig.subplots_adjust(hspace=0.1, wspace=0.12, left=0.05, right=0.95, bottom=0.05, top=0.92)
-    fig.suptitle("t = {}, Total floor hits: {}".format(int(dump['t']), np.sum(dump['fflag'] > 0)))
+    fig.suptitle("t = {}, Total floor hits: {}".format(int(dump['t']), np.count_nonzero(fflag > 0)))
     return fig
 
 def fails(fig, dump, diag, plotrc):
     """In-depth plots of inversion failures
     """
-    ax_slc = lambda i: plt.subplot(2, 4, i)
+    ax_slc = lambda i: _subplot(fig, 2, 4, i)
     plotrc['xlabel'] = False
     plotrc['xticks'] = []
     plotrc['log'] = True
@@ -409,6 +475,8 @@ def fails(fig, dump, diag, plotrc):
     plotrc['cmap'] = 'Reds'
     plotrc['sum'] = True
     plotrc['log'] = False
+    # Count every failure type in one pass over pflag
+    counts = phi_value_counts(dump['pflag'], range(1, 8))
     for i in range(1, 8):
         p = 1+i
         plotrc['cbar'] = (p % 4 == 0)
@@ -426,21 +494,22 @@ def fails(fig, dump, diag, plotrc):
             plotrc['ylabel'] = True
             plotrc['yticks'] = None
 
-        plot_xz(ax_slc(p), dump, dump['pflag'] == i, label=InversionStatus(i).name, **plotrc)
+        plot_xz(ax_slc(p), dump, counts[i-1], label=InversionStatus(i).name, **plotrc)
     fig.subplots_adjust(hspace=0.1, wspace=0.12, left=0.05, right=0.95, bottom=0.05, top=0.92)
-    fig.suptitle("t = {}, Total inversion failures: {}".format(int(dump['t']), np.sum(dump['pflag'] > 0)))
+    fig.suptitle("t = {}, Total inversion failures: {}".format(int(dump['t']), np.count_nonzero(dump['fail_mask'])))
     return fig
 
 def old_floors(fig, dump, diag, plotrc):
     """Plot floor hits from iharm3d output
     """
-    ax_slc = lambda i: plt.subplot(2, 3, i)
+    ax_slc = lambda i: _subplot(fig, 3, 3, i)
     plot_xz(ax_slc(1), dump, 'rho', label=pretty('rho'), **plotrc)
     plotrc['vmin'] = 0
     plotrc['vmax'] = 20
     plotrc['cmap'] = 'Reds'
     plotrc['sum'] = True
+    hits = phi_bit_counts(dump['fflag'], [ff.value for ff in FloorFlag_iharm3d])
     for i,ff in enumerate(FloorFlag_iharm3d):
-        plot_xz(ax_slc(2+i), dump, dump['fflag'] & ff.value, label=ff.name, **plotrc)
+        plot_xz(ax_slc(2+i), dump, hits[i] * ff.value, label=ff.name, **plotrc)
 
     return fig
@@ -39,6 +39,7 @@ import glob
 import numpy as np
 
 import matplotlib.pyplot as plt
+import psutil
 
 from .. import io
 from ..fluid_state import FluidState
@@ -55,6 +56,9 @@ included in pyharm so as to be imported there easily.
 The code in `figures` would be a better place to start in writing your own additional movies/plots.
 """
 
+# Figures kept between frames when re-using axes, by movie type
+_frame_figures = {}
+
 def do_plot(fig, dump, diag, movie_type, plotrc):
         # PLOT
         if movie_type in figures.__dict__:
@@ -274,8 +278,16 @@ def frame(fname, diag, kwargs):
         plotrc['overlay_field'] = \
             'overlay_field' in kwargs and kwargs['overlay_field'] and not plotrc['native']
 
-        fig = plt.figure(figsize=(kwargs['fig_x'], kwargs['fig_y']))
-        
+        # Named figures can re-use their Axes from the last frame, which is much faster than re-creating them
+        reuse_axes = 'reuse_axes' in kwargs and kwargs['reuse_axes'] and movie_type in figures.__dict__
+        if reuse_axes and movie_type in _frame_figures:
+            fig = _frame_figures[movie_type]
+            figures._reset_figure(fig)
+        else:
+            fig = plt.figure(figsize=(kwargs['fig_x'], kwargs['fig_y']))
+            if reuse_axes:
+                _frame_figures[movie_type] = fig
+
         # Plot the dump we were assigned
         do_plot(fig, dump, diag, movie_type, plotrc)
 
@@ -283,6 +295,9 @@ def frame(fname, diag, kwargs):
             # plot outlines of the current run *above* the current run
             # use circles to avoid contour computation/ugliness
             for ax in fig.axes:
+                # History plots are kept between frames (see _reset_figure), and have no radius
+                if '_pyharm_hst' in ax.__dict__:
+                    continue
                 if plotrc['native']:
                     ax.axvline(dump['startx1_active'], color='r')
                     ax.axvline(dump['stopx1_active'], color='r')
@@ -326,8 +341,16 @@ def frame(fname, diag, kwargs):
                 fig.suptitle("t = {}".format(int(tdump)))
 
         # Save by name, clean up
-        plt.savefig(frame_name, dpi=kwargs['fig_dpi'])
-        plt.close()
+        fig.savefig(frame_name, dpi=kwargs['fig_dpi'])
+        if not reuse_axes:
+            # Clearing first breaks the reference cycles between the figure and its artists,
+            # so the image data is freed now rather than whenever the garbage collector next runs
+            fig.clear()
+            plt.close(fig)
+
+        if "PYHARM_DEBUG_MEM" in os.environ:
+            print("Imaged t={} {}, RSS {:.1f}MB".format(int(tdump), movie_type,
+                  psutil.Process().memory_info().rss / 1024**2), file=sys.stderr)
 
     del dump
     return len(movie_types)
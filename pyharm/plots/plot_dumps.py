@@ -75,7 +75,8 @@ def _decorate_plot(ax, dump, var, bh=True, xticks=None, yticks=None, frame=True,
     if cbar:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.05)
-        cbar = plt.colorbar(ax.collections[0], cax=cax)
+        # Plots on regular grids are drawn as images rather than meshes
+        cbar = plt.colorbar(ax.collections[0] if len(ax.collections) > 0 else ax.images[0], cax=cax)
         if cbar_ticks is not None:
             cbar.set_ticks(cbar_ticks)
         if cbar_label is not None:
@@ -99,7 +100,7 @@ def _decorate_plot(ax, dump, var, bh=True, xticks=None, yticks=None, frame=True,
 def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
             xlabel=True, ylabel=True, native=False, log=False,
             half_cut=False, cmap='jet', shading='gouraud',
-            at=None, average=False, sum=False, cbar=True, log_r=False, **kwargs):
+            at=None, average=False, sum=False, cbar=True, log_r=False, quantize=False, **kwargs):
     """Plot a poloidal or X1/X2 slice of a dump file.
     Note this function also accepts all keyword arguments to _decorate_plot()
 
@@ -110,6 +111,7 @@ def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
     :param xlabel, ylabel: whether to mark X/Y labels with reasonable titles
     :param native: Plot in native coordinates X1/X2 as plot X/Y axes respectively
     :param log: plot a signed quantity in logspace with symlog() above
+    :param quantize: keep images of regular meshes as 8-bit color only, see quantize_image
     """
 
     vname = None
@@ -125,7 +127,7 @@ def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
     x, z = dump.grid.get_xz_locations(mesh=(shading == 'flat'), native=native, half_cut=(half_cut or native), log_r=log_r)
     var = flatten_xz(dump, var, at, sum or average, half_cut or native)
     if average:
-        var /= dump['n3']
+        var = var / dump['n3']
     if shading != 'flat':
         x = wrap(x)
         z = wrap(z)
@@ -147,8 +149,8 @@ def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
                               shading=shading, cbar=cbar) # Use this cbar, it's customized
         cbar = False # We don't need another later on
     else:
-        mesh = ax.pcolormesh(x, z, var, cmap=cmap, vmin=vmin, vmax=vmax,
-                             shading=shading)
+        mesh = pcolormesh_fast(ax, x, z, var, cmap=cmap, vmin=vmin, vmax=vmax,
+                               shading=shading)
 
     if native:
         if xlabel: ax.set_xlabel("X1 (native coordinates)")
@@ -190,6 +192,9 @@ def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
         if log:
             var = "log_"+var
     _decorate_plot(ax, dump, var, cbar=cbar, log_r=log_r, **kwargs)
+    if quantize:
+        # After any colorbar is drawn from the full-precision data
+        quantize_image(mesh)
 
     # In case user wants to tweak this
     return mesh
@@ -197,7 +202,7 @@ def plot_xz(ax, dump, var, vmin=None, vmax=None, window=(-40, 40, -40, 40),
 def plot_xy(ax, dump, var, vmin=None, vmax=None, window=None,
             xlabel=True, ylabel=True, native=False, log=False,
             cmap='jet', shading='gouraud',
-            at=None, average=False, sum=False, cbar=True, log_r=False, **kwargs):
+            at=None, average=False, sum=False, cbar=True, log_r=False, quantize=False, **kwargs):
     """Plot a toroidal or X1/X3 slice of a dump file.
     Note this function also accepts all keyword arguments to _decorate_plot()
 
@@ -208,6 +213,7 @@ def plot_xy(ax, dump, var, vmin=None, vmax=None, window=None,
     :param xlabel, ylabel: whether to mark X/Y labels with reasonable titles
     :param native: Plot in native coordinates X1/X2 as plot X/Y axes respectively
     :param log: plot a signed quantity in logspace with symlog() above
+    :param quantize: keep images of regular meshes as 8-bit color only, see quantize_image
     """
 
 
@@ -228,7 +234,7 @@ def plot_xy(ax, dump, var, vmin=None, vmax=None, window=None,
     x, y = dump.grid.get_xy_locations(mesh=(shading == 'flat'), native=native, log_r=log_r)
     var = flatten_xy(dump, var, at, sum or average)
     if average:
-        var /= dump['n2']
+        var = var / dump['n2']
     if shading != 'flat':
         x = wrap(x)
         y = wrap(y)
@@ -251,8 +257,8 @@ def plot_xy(ax, dump, var, vmin=None, vmax=None, window=None,
                               shading=shading, cbar=cbar) # Use this cbar, it's customized
         cbar = False # We don't need another later on
     else:
-        mesh = ax.pcolormesh(x, y, var, cmap=cmap, vmin=vmin, vmax=vmax,
-                         shading=shading)
+        mesh = pcolormesh_fast(ax, x, y, var, cmap=cmap, vmin=vmin, vmax=vmax,
+                               shading=shading)
 
     if native:
         if xlabel: ax.set_xlabel("X1 (native coordinates)")
@@ -295,6 +301,9 @@ def plot_xy(ax, dump, var, vmin=None, vmax=None, window=None,
         if log:
             var = "log_"+var
     _decorate_plot(ax, dump, var, cbar=cbar, log_r=log_r, **kwargs)
+    if quantize:
+        # After any colorbar is drawn from the full-precision data
+        quantize_image(mesh)
 
     # In case user wants to tweak this
     return mesh
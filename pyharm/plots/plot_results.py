@@ -42,14 +42,23 @@ import matplotlib
 
 from ..ana_results import AnaResults
 from .pretty import pretty
+from .plot_utils import decimate_minmax
 
-def plot_hst(ax, diag, var, tline=None, xticklabels=None, xlabel=None, **kwargs):
-    """Plot a scalar vs t, optionally marking with a red line representing current time"""
+def plot_hst(ax, diag, var, tline=None, xticklabels=None, xlabel=None, decimate=True, **kwargs):
+    """Plot a scalar vs t, optionally marking with a red line representing current time.
+    Returns the time marker line, if any, so that it can be moved later with set_xdata.
 
-    ax.plot(*diag.get_result('t', var), label=pretty(var), **kwargs)
+    :param decimate: reduce long histories to ~2 points per pixel of the plot width before plotting,
+                     keeping the extremes in each interval.
+    """
+    t, v = diag.get_result('t', var)
+    if decimate:
+        t, v = decimate_minmax(t, v, 2*int(ax.get_window_extent().width))
+    ax.plot(t, v, label=pretty(var), **kwargs)
 
+    cursor = None
     if tline is not None:
-        ax.axvline(tline, color='r')
+        cursor = ax.axvline(tline, color='r')
 
     ax.legend(loc='upper left')
     ax.grid(True)
@@ -62,4 +71,6 @@ def plot_hst(ax, diag, var, tline=None, xticklabels=None, xlabel=None, **kwargs)
     if xlabel is not None:
         ax.set_xlabel(xlabel)
 
+    return cursor
+
 
@@ -35,13 +35,105 @@ __license__ = """
 import numpy as np
 
 import matplotlib.pyplot as plt
-from matplotlib import colors, ticker
+from matplotlib import axis, colors, projections, ticker
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.image import AxesImage
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 __doc__ = """Generic utilities and plot types -- anything plotting-related which is
 potentially useful (or indeed stolen from) outside pyharm
 """
 
+class _ThinAxis:
+    """Axis methods which would otherwise build tick objects just to restyle them"""
+    def set_clip_path(self, path, transform=None):
+        Artist.set_clip_path(self, path, transform)
+    def set_tick_params(self, which='major', reset=False, **kwargs):
+        pass
+    def grid(self, visible=None, which='major', **kwargs):
+        pass
+
+class _ThinXAxis(_ThinAxis, axis.XAxis):
+    pass
+
+class _ThinYAxis(_ThinAxis, axis.YAxis):
+    pass
+
+class ThinAxes(Axes):
+    """Axes for plots which will never show ticks or a frame, e.g. outreach movies.
+    Use with ``fig.add_subplot(..., projection='thin')``.
+    Tick parameters and gridlines are ignored, which avoids most of the cost of creating a new Axes.
+    """
+    name = 'thin'
+
+    def _init_axis(self):
+        self.xaxis = _ThinXAxis(self, clear=False)
+        self.spines.bottom.register_axis(self.xaxis)
+        self.spines.top.register_axis(self.xaxis)
+        self.yaxis = _ThinYAxis(self, clear=False)
+        self.spines.left.register_axis(self.yaxis)
+        self.spines.right.register_axis(self.yaxis)
+
+projections.register_projection(ThinAxes)
+
+def uniform_extent(X, Y):
+    """Return the imshow-style extent [x0, x1, y0, y1] if the mesh corners X, Y describe a regular,
+    axis-aligned grid (e.g. native coordinates), otherwise None.
+    """
+    X, Y = np.asarray(X), np.asarray(Y)
+    if X.ndim != 2 or X.shape != Y.shape or X.shape[0] < 2 or X.shape[1] < 2:
+        return None
+    x, y = X[:, 0], Y[0, :]
+    if not (np.allclose(X, x[:, None]) and np.allclose(Y, y[None, :])):
+        return None
+    dx, dy = np.diff(x), np.diff(y)
+    if not (np.allclose(dx, dx[0]) and np.allclose(dy, dy[0])):
+        return None
+    return [x[0], x[-1], y[0], y[-1]]
+
+def pcolormesh_fast(ax, X, Y, Z, shading='flat', **kwargs):
+    """Wrapper for matplotlib's pcolormesh which draws with imshow instead whenever the mesh is regular.
+    Rendering an image is much faster than rendering the equivalent set of quads.
+    Only applies to flat shading, where X and Y are mesh corners one larger than Z in each dimension.
+    """
+    extent = None
+    if shading == 'flat' and np.ndim(Z) == 2 and np.shape(X) == (Z.shape[0]+1, Z.shape[1]+1):
+        extent = uniform_extent(X, Y)
+    if extent is None:
+        return ax.pcolormesh(X, Y, Z, shading=shading, **kwargs)
+    return ax.imshow(np.asarray(Z).T, origin='lower', extent=extent, aspect='auto',
+                     interpolation='nearest', **kwargs)
+
+def quantize_image(im):
+    """Apply the colormap of an image from pcolormesh_fast immediately, keeping only its 8-bit RGBA colors
+    rather than resampling the full-precision data each time it is drawn.
+    The image keeps its norm and colormap, but any colorbar must be added *before* calling this.
+    Meshes are left alone.
+    """
+    if isinstance(im, AxesImage) and im.get_array().ndim == 2:
+        im.set_data(im.to_rgba(im.get_array(), bytes=True))
+    return im
+
+def decimate_minmax(x, y, npoints):
+    """Reduce a line x, y to about npoints points for plotting, by keeping only the minimum and maximum
+    of y in each of npoints/2 bins. Unlike plain striding or averaging, this preserves any spikes.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    # Too few points to bin into (e.g. a zero-width Axes) leaves the line as-is
+    if npoints is None or npoints < 2 or len(y) <= npoints:
+        return x, y
+    stride = int(np.ceil(2 * len(y) / npoints))
+    nbins = len(y) // stride
+    xb = x[:nbins*stride].reshape(nbins, stride)
+    yb = y[:nbins*stride].reshape(nbins, stride)
+    imin, imax = np.argmin(yb, axis=1), np.argmax(yb, axis=1)
+    # Keep each pair in its original order
+    idx = np.stack((np.minimum(imin, imax), np.maximum(imin, imax)), axis=1)
+    rows = np.arange(nbins)[:, None]
+    return (np.append(xb[rows, idx].ravel(), x[nbins*stride:]),
+            np.append(yb[rows, idx].ravel(), y[nbins*stride:]))
+
 def pcolormesh_symlog(ax, X, Y, Z, vmax=None, vmin=None, linthresh=None, decades=4, linscale=0.01, cmap='RdBu_r', cbar=True, **kwargs):
     """Wrapper for matplotlib's pcolormesh that uses it sensibly, instead of the defaults.
 
@@ -75,8 +167,8 @@ def pcolormesh_symlog(ax, X, Y, Z, vmax=None, vmin=None, linthresh=None, decades
                       + [0.0]
                       + [(10.0 ** x) for x in range(logthresh, int_max_pow)]
                       + [vmax])
-    pcm = ax.pcolormesh(X, Y, Z, norm=colors.SymLogNorm(linthresh=linthresh, linscale=linscale, base=10, vmin=-vmax, vmax=vmax),
-                         cmap=cmap, **kwargs)
+    pcm = pcolormesh_fast(ax, X, Y, Z, norm=colors.SymLogNorm(linthresh=linthresh, linscale=linscale, base=10, vmin=-vmax, vmax=vmax),
+                          cmap=cmap, **kwargs)
     if cbar:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.05)
@@ -91,8 +183,8 @@ def pcolormesh_log(ax, X, Y, Z, vmax=None, vmin=None, cmap='jet', cbar=True, **k
     In order to keep colors sensible, vmin is overridden unless set alone.
     """
 
-    pcm = ax.pcolormesh(X, Y, Z, norm=colors.LogNorm(vmin=vmin, vmax=vmax),
-                         cmap=cmap, **kwargs)
+    pcm = pcolormesh_fast(ax, X, Y, Z, norm=colors.LogNorm(vmin=vmin, vmax=vmax),
+                          cmap=cmap, **kwargs)
     if cbar:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.05)
@@ -60,6 +60,9 @@ def i_of(var, val, behind=True, fail=False):
     """Convenience for finding zone containing a given value,
     in coordinate/monotonic-increase variables
     """
+    # Compare plain floats: indexing an array element-by-element is slow, especially jax arrays
+    if hasattr(var, 'tolist'):
+        var = var.tolist()
     i = 0
     while var[i] < val:
         i += 1
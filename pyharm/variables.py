@@ -83,6 +83,7 @@ fns_dict = {# 4-vectors
             'Pb': lambda dump: dump['bsq'] / 2,
             'Ptot': lambda dump: dump['Pg'] + dump['Pb'],
             'beta': lambda dump: dump['Pg'] / dump['Pb'],
+            'inv_beta': lambda dump: dump['Pb'] / dump['Pg'],
             'sigma': lambda dump: dump['bsq'] / dump['RHO'],
             'Theta': lambda dump: (dump['gam'] - 1) * dump['UU'] / dump['RHO'],
             # entropy
@@ -130,6 +131,7 @@ fns_dict = {# 4-vectors
             'divB_prims': lambda dump: divB(dump.grid, dump['B']),
             'divB_cons': lambda dump: divB_cons(dump.grid, dump['cons.B']),
             'divB_cons_rel': lambda dump: divB_cons(dump.grid, dump['cons.B']) / dump['b'] / dump["gdet"] * dump["dx1"],
+            'fail_mask': lambda dump: (dump['pflag'] > 0).astype(jnp.uint8),
             # Electrons: largely need units
             'Thetap': lambda dump: (dump['gam_p'] - 1) * dump['UU'] / dump['RHO'],
             'Thetae': lambda dump: (dump['gam_e'] - 1) * dump['UU'] / dump['RHO'],
@@ -0,0 +1,97 @@
+__license__ = """
+ File: test_plot_utils.py
+ 
+ BSD 3-Clause License
+ 
+ Copyright (c) 2020-2023, Ben Prather and AFD Group at UIUC
+ All rights reserved.
+ 
+ Redistribution and use in source and binary forms, with or without
+ modification, are permitted provided that the following conditions are met:
+ 
+ 1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+ 
+ 2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+ 
+ 3. Neither the name of the copyright holder nor the names of its
+    contributors may be used to endorse or promote products derived from
+    this software without specific prior written permission.
+ 
+ THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+__doc__ = """\
+Test the generic plotting utilities.
+"""
+import numpy as np
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.collections import QuadMesh
+from matplotlib.image import AxesImage
+
+from pyharm.plots.plot_utils import decimate_minmax, uniform_extent, pcolormesh_fast
+from pyharm.plots import figures
+
+def test_decimate_minmax():
+    x = np.arange(100000, dtype=np.float64)
+    y = np.sin(x / 1000)
+    y[54321] = 10.
+    xd, yd = decimate_minmax(x, y, 1000)
+    assert len(xd) <= 1002
+    # Extremes and spikes survive, and the line stays in order
+    assert np.max(yd) == 10.
+    assert np.isclose(np.min(yd), np.min(y))
+    assert np.all(np.diff(xd) > 0)
+    # Short lines are untouched
+    assert len(decimate_minmax(x[:10], y[:10], 1000)[0]) == 10
+    # As are lines plotted on degenerate (zero-width) Axes
+    assert len(decimate_minmax(x, y, 0)[0]) == len(x)
+
+def test_uniform_extent():
+    X, Y = np.meshgrid(np.linspace(0, 1, 5), np.linspace(2, 4, 3), indexing='ij')
+    assert np.allclose(uniform_extent(X, Y), [0, 1, 2, 4])
+    # Curvilinear meshes aren't
+    assert uniform_extent(X * (1 + Y), Y) is None
+
+def test_pcolormesh_fast():
+    X, Y = np.meshgrid(np.linspace(0, 1, 5), np.linspace(2, 4, 3), indexing='ij')
+    Z = np.arange(8, dtype=np.float64).reshape(4, 2)
+    fig, ax = plt.subplots()
+    # Regular meshes with flat shading are drawn as images...
+    assert isinstance(pcolormesh_fast(ax, X, Y, Z), AxesImage)
+    # ...but curvilinear meshes and gouraud shading still need quads
+    assert isinstance(pcolormesh_fast(ax, X * (1 + Y), Y, Z), QuadMesh)
+    Xc, Yc = np.meshgrid(np.linspace(0, 1, 4), np.linspace(2, 4, 2), indexing='ij')
+    assert isinstance(pcolormesh_fast(ax, Xc, Yc, Z, shading='gouraud'), QuadMesh)
+    plt.close(fig)
+
+def test_plot_hst_reuse():
+    t = np.linspace(0, 100, 200)
+    diag = {'time': t, 'Mdot_EH_Flux': np.ones_like(t), 'Phi_EH': 1 + np.sin(t)}
+    fig = plt.figure()
+    ax = figures._subplot(fig, 1, 1, 1)
+    figures._plot_hst(ax, diag, 'phi_b', 10)
+    cursor = ax._pyharm_hst[1]
+    # The same history, even a copy of it, just moves the time marker...
+    figures._reset_figure(fig)
+    figures._plot_hst(ax, dict(diag), 'phi_b', 20)
+    assert ax._pyharm_hst[1] is cursor and list(cursor.get_xdata()) == [20, 20]
+    # ...but a different one with the same times is re-drawn
+    figures._reset_figure(fig)
+    figures._plot_hst(ax, {**diag, 'Phi_EH': 5 * diag['Phi_EH']}, 'phi_b', 30)
+    assert np.isclose(np.max(ax.lines[0].get_ydata()), 5 * np.max(diag['Phi_EH']))
+    plt.close(fig)
@@ -0,0 +1,122 @@
+__license__ = """
+ File: test_reductions.py
+ 
+ BSD 3-Clause License
+ 
+ Copyright (c) 2020-2023, Ben Prather and AFD Group at UIUC
+ All rights reserved.
+ 
+ Redistribution and use in source and binary forms, with or without
+ modification, are permitted provided that the following conditions are met:
+ 
+ 1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+ 
+ 2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+ 
+ 3. Neither the name of the copyright holder nor the names of its
+    contributors may be used to endorse or promote products derived from
+    this software without specific prior written permission.
+ 
+ THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+__doc__ = """\
+Test the reductions used for plotting, and that their caches aren't disturbed by plotting.
+"""
+import numpy as np
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from pyharm.fluid_state import FluidState
+from pyharm.grid import Grid
+from pyharm.ana import reductions
+from pyharm.ana.reductions import phi_sum, _slice_at, phi_bit_counts, phi_value_counts, shell_sum, shell_sums_T_mixed
+from pyharm.variables import T_mixed
+from pyharm.plots.plot_dumps import plot_xz
+
+# Small FMKS grid, just large enough to plot
+params = {'coordinates': 'fmks', 'a': 0.9375,
+          'r_in': 1.2175642950007606, 'r_out': 100.0,
+          'hslope': 0.3, 'mks_smooth': 0.5, 'poly_xt': 0.82, 'poly_alpha': 14.0,
+          'n1': 16, 'n2': 8, 'n3': 4, 'gam': 13./9}
+
+def make_state():
+    # Plain numpy arrays, like the file readers return, so in-place changes would stick
+    rng = np.random.default_rng(0)
+    shape = (params['n1'], params['n2'], params['n3'])
+    grid = Grid(params)
+    # Zone sizes come with the parameters, as when reading a file
+    dump_params = dict(params, dx1=grid.dx[1], dx2=grid.dx[2], dx3=grid.dx[3])
+    return FluidState({'rho': rng.uniform(0.1, 1, shape), 'u': rng.uniform(0.01, 0.1, shape),
+                       'uvec': rng.uniform(-0.1, 0.1, (3,)+shape), 'B': rng.uniform(-1, 1, (3,)+shape)},
+                      params=dump_params, grid=grid)
+
+def test_phi_sum():
+    state = make_state()
+    rho_sum = phi_sum(state, 'rho')
+    assert np.allclose(rho_sum, np.sum(state['rho'], axis=-1))
+    # Cached per dump
+    assert phi_sum(state, 'rho') is rho_sum
+
+def test_phi_sum_unchanged_by_plots():
+    state = make_state()
+    expected = np.array(phi_sum(state, 'rho'))
+    fig, ax = plt.subplots()
+    for _ in range(3):
+        plot_xz(ax, state, 'rho', average=True, half_cut=True, cbar=False)
+        plot_xz(ax, state, 'rho', average=True, cbar=False)
+    plt.close(fig)
+    assert np.allclose(phi_sum(state, 'rho'), expected)
+
+def test_slice_at():
+    state = make_state()
+    slc = _slice_at(state, 2, 1)
+    assert np.allclose(slc['rho'], state['rho'][:, :, 1:2])
+    # Re-used, so anything computed on the slice is kept for the next plot
+    assert _slice_at(state, 2, 1) is slc
+    assert _slice_at(state, 2, 2) is not slc
+    assert np.allclose(_slice_at(state, 1, 3)['rho'], state['rho'][:, 3:4, :])
+
+def test_phi_bit_counts(monkeypatch):
+    fflag = np.random.default_rng(1).integers(0, 4096, (16, 8, 4))
+    bits = [32, 64, 2048]
+    # Force several X1 blocks
+    monkeypatch.setattr(reductions, '_COUNT_BLOCK', 3*8*4)
+    hits = phi_bit_counts(fflag, bits)
+    assert hits.shape == (3, 16, 8)
+    for i, b in enumerate(bits):
+        assert np.all(hits[i] == ((fflag & b) != 0).sum(-1))
+
+def test_phi_value_counts(monkeypatch):
+    pflag = np.random.default_rng(2).integers(-1, 9, (16, 8, 4))
+    monkeypatch.setattr(reductions, '_COUNT_BLOCK', 3*8*4)
+    counts = phi_value_counts(pflag, range(1, 8))
+    assert counts.shape == (7, 16, 8)
+    for i in range(1, 8):
+        assert np.all(counts[i-1] == (pflag == i).sum(-1))
+
+def test_shell_sums_T_mixed():
+    state = make_state()
+    components = [(0, 0), (0, 3), (1, 0)]
+    # Also on a radial slice, as used by the 'conservation' figure
+    for dump in (state, state[:10, :, :]):
+        sums = shell_sums_T_mixed(dump, components, mass_flux=True)
+        assert len(sums) == 4
+        for (i, j), s in zip(components, sums):
+            assert np.allclose(s, shell_sum(dump, T_mixed(dump, i, j)), rtol=1e-5)
+        assert np.allclose(sums[-1], shell_sum(dump, dump['ucon'][0]*dump['RHO']), rtol=1e-5)
+        assert sums[-1].shape == dump['rho'].shape[:1]